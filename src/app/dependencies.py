@@ -6,15 +6,11 @@
 
 from typing import Annotated
 
-from fastapi import Depends
+from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.infrastructure.db import get_db
-from src.infrastructure.repositories import (
-    DictionaryRepository,
-    HistoryRepository,
-    UserRepository,
-)
+from src.infrastructure.repositories import UserRepository
 from src.services.linguistic import LinguisticService
 
 
@@ -32,46 +28,17 @@ async def get_user_repository(
     return UserRepository(session)
 
 
-async def get_history_repository(
-    session: Annotated[AsyncSession, Depends(get_db)],
-) -> HistoryRepository:
-    """Получает экземпляр репозитория истории.
-
-    Args:
-        session: Сессия базы данных.
-
-    Returns:
-        HistoryRepository: Экземпляр репозитория истории.
-    """
-    return HistoryRepository(session)
-
-
-async def get_dictionary_repository(
-    session: Annotated[AsyncSession, Depends(get_db)],
-) -> DictionaryRepository:
-    """Получает экземпляр репозитория словаря.
-
-    Args:
-        session: Сессия базы данных.
-
-    Returns:
-        DictionaryRepository: Экземпляр репозитория словаря.
-    """
-    return DictionaryRepository(session)
-
-
-async def get_linguistic_service(
-    dictionary_repo: Annotated[DictionaryRepository, Depends(get_dictionary_repository)],
-    history_repo: Annotated[HistoryRepository, Depends(get_history_repository)],
-) -> LinguisticService:
+async def get_linguistic_service(request: Request) -> LinguisticService:
     """Получает экземпляр лингвистического сервиса.
 
+    Сервис создается один раз в lifespan приложения и сам открывает сессии
+    через фабрику, поэтому не требует сессии из get_db.
+
     Args:
-        dictionary_repo: Репозиторий словаря.
-        history_repo: Репозиторий истории.
+        request: Объект запроса FastAPI.
 
     Returns:
-        LinguisticService: Экземпляр лингвистического сервиса.
+        LinguisticService: Общий экземпляр лингвистического сервиса.
     """
-    return LinguisticService(dictionary_repo, history_repo)
+    return request.app.state.linguistic_service
 
@@ -7,21 +7,36 @@ middleware, статические файлы и подключает роуте
 from contextlib import asynccontextmanager
 from pathlib import Path
 
+import orjson
 from fastapi import FastAPI, Request, status
+from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 
 from src.app.routers import linguistic, web
-from src.app.templates import templates
+from src.app.templates import templates, warmup_templates
 from src.core import settings
 from src.core.exceptions import AppError
 from src.core.logger import get_logger, setup_logger
+from src.infrastructure.db import get_session_factory
+from src.services.linguistic import LinguisticService, close_http_client
 
 setup_logger()
 logger = get_logger(__name__)
 
+# Неизменяемые тела ответов сериализуются один раз при импорте
+_HEALTH_BODY = orjson.dumps({"status": "ok", "env": settings.APP_ENV})
+_INTERNAL_ERROR_BODY = orjson.dumps(
+    {
+        "error": {
+            "code": "internal_server_error",
+            "message": "Произошла внутренняя ошибка сервера",
+        }
+    }
+)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -31,7 +46,11 @@ async def lifespan(app: FastAPI):
         app: Экземпляр приложения FastAPI.
     """
     logger.info("Application startup")
+    warmup_templates()
+    app.state.linguistic_service = LinguisticService(get_session_factory())
     yield
+    await app.state.linguistic_service.close()
+    await close_http_client()
     logger.info("Application shutdown")
 
 
@@ -40,17 +59,21 @@ app = FastAPI(
     description="API для лингвистического сервиса на базе LangChain и LangGraph",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     debug=settings.APP_ENV == "development",
 )
 
 # Middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Веб-интерфейс отдается тем же приложением, поэтому CORS нужен только
+# для явно перечисленных внешних источников
+if settings.CORS_ORIGINS:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.CORS_ORIGINS,
+        allow_credentials=True,
+        allow_methods=["GET", "POST"],
+        allow_headers=["content-type", "hx-request", "hx-target", "hx-current-url", "hx-trigger"],
+    )
 
 # Static
 BASE_DIR = Path(__file__).resolve().parent
@@ -97,7 +120,7 @@ async def app_error_handler(request: Request, exc: AppError):
         exc: Экземпляр AppError.
 
     Returns:
-        JSONResponse: Ответ с деталями ошибки.
+        ORJSONResponse: Ответ с деталями ошибки.
     """
     logger.error(
         "Application error occurred",
@@ -106,7 +129,7 @@ async def app_error_handler(request: Request, exc: AppError):
         message=exc.message,
         details=exc.details,
     )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": {
@@ -127,21 +150,17 @@ async def universal_exception_handler(request: Request, exc: Exception):
         exc: Экземпляр исключения.
 
     Returns:
-        JSONResponse: Ответ с кодом 500.
+        Response: Заранее сериализованный JSON-ответ с кодом 500.
     """
     logger.exception(
         "Unhandled exception occurred",
         path=request.url.path,
         error_type=type(exc).__name__,
     )
-    return JSONResponse(
+    return Response(
+        content=_INTERNAL_ERROR_BODY,
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "error": {
-                "code": "internal_server_error",
-                "message": "Произошла внутренняя ошибка сервера",
-            }
-        },
+        media_type="application/json",
     )
 
 
@@ -154,20 +173,20 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         exc: Экземпляр исключения валидации.
 
     Returns:
-        JSONResponse: Ответ с кодом 422 и списком ошибок.
+        ORJSONResponse: Ответ с кодом 422 и списком ошибок.
     """
     logger.error(
         "Validation error occurred",
         path=request.url.path,
         errors=exc.errors(),
     )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": {
                 "code": "validation_error",
                 "message": "Ошибка валидации входных данных",
-                "details": exc.errors(),
+                "details": jsonable_encoder(exc.errors()),
             }
         },
     )
@@ -178,7 +197,7 @@ async def health_check():
     """Проверка работоспособности сервиса.
 
     Returns:
-        dict: Статус сервиса и текущее окружение.
+        Response: Заранее сериализованный JSON со статусом сервиса и текущим окружением.
     """
-    return {"status": "ok", "env": settings.APP_ENV}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
@@ -4,7 +4,6 @@
 с использованием кэширования в базе данных и обработки через LangGraph.
 """
 
-import uuid
 from typing import Annotated
 
 from fastapi import APIRouter, Depends
@@ -38,21 +37,20 @@ async def analyze_text(
     Returns:
         LinguisticResponse: Результат лингвистического анализа.
     """
-    word = request.text.strip().lower()
+    # Схема запроса уже нормализовала и проверила слово
+    word = request.text
     logger.info("API analysis request", word=word)
 
     result = await service.analyze_word(word, source="api")
 
     if result["status"] == ProcessingStatus.FAILED:
-        return LinguisticResponse(
-            request_id=uuid.uuid4(),
+        return LinguisticResponse.model_construct(
             original_text=word,
             status=ProcessingStatus.FAILED,
             error=result["error"]
         )
 
-    return LinguisticResponse(
-        request_id=uuid.uuid4(),
+    return LinguisticResponse.model_construct(
         original_text=word,
         status=ProcessingStatus.COMPLETED,
         result=result["result"],
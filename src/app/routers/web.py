@@ -37,23 +37,35 @@ async def analyze_web(
     Returns:
         TemplateResponse: HTML-фрагмент partials/result.html.
     """
-    logger.info("Web analysis request", text=text)
+    word = WordValidator.normalize(text)
+    logger.info("Web analysis request", word=word)
 
-    if not WordValidator.is_cyrillic(text):
+    if not WordValidator.is_cyrillic_word(word):
         return templates.TemplateResponse(
             "partials/result.html",
             {
                 "request": request,
-                "original_text": text,
+                "original_text": word,
                 "error": "Пожалуйста, используйте только кириллицу.",
                 "result": None,
             },
         )
 
-    result = await service.analyze_word(text, source="web")
+    if WordValidator.is_too_long(word):
+        return templates.TemplateResponse(
+            "partials/result.html",
+            {
+                "request": request,
+                "original_text": word,
+                "error": "Слишком длинное слово. Попробуйте что-то короче.",
+                "result": None,
+            },
+        )
+
+    result = await service.analyze_word(word, source="web")
     context = {
         "request": request,
-        "original_text": text,
+        "original_text": word,
         "result": result.get("result"),
         "error": result.get("error"),
         "status": result.get("status"),
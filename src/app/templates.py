@@ -1,10 +1,33 @@
 """Конфигурация шаблонов Jinja2.
 
 Этот модуль инициализирует объект Jinja2Templates для использования в приложении.
+Скомпилированные шаблоны сохраняются в байткод-кэш, а в продакшене Jinja
+не проверяет время изменения файлов при каждом рендере.
 """
 
 from pathlib import Path
+
 from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+from src.core import settings
 
 BASE_DIR = Path(__file__).resolve().parent
-templates = Jinja2Templates(directory=BASE_DIR / "templates")
+
+env = Environment(
+    loader=FileSystemLoader(BASE_DIR / "templates"),
+    autoescape=True,
+    bytecode_cache=FileSystemBytecodeCache(),
+    auto_reload=settings.APP_ENV == "development",
+)
+templates = Jinja2Templates(env=env)
+
+
+def warmup_templates() -> None:
+    """Предварительно компилирует все шаблоны.
+
+    Загружает каждый шаблон в кэш окружения (и байткод-кэш), чтобы первый
+    запрос после старта не тратил время на разбор исходников.
+    """
+    for name in env.list_templates():
+        env.get_template(name)
@@ -0,0 +1,47 @@
+"""Зависимости Telegram-бота.
+
+Этот модуль предоставляет middleware для внедрения в хендлеры общих объектов,
+которые создаются один раз при старте бота (см. src.bot.main.main).
+"""
+
+from typing import Any, Awaitable, Callable, Dict
+
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject
+
+from src.services.linguistic import LinguisticService
+
+
+class ServiceMiddleware(BaseMiddleware):
+    """Middleware, передающий лингвистический сервис в обработчики.
+
+    Attributes:
+        service: Общий экземпляр лингвистического сервиса.
+    """
+
+    def __init__(self, service: LinguisticService):
+        """Инициализирует middleware.
+
+        Args:
+            service: Экземпляр лингвистического сервиса.
+        """
+        self.service = service
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any],
+    ) -> Any:
+        """Добавляет сервис в данные обработчика и вызывает его.
+
+        Args:
+            handler: Следующий обработчик в цепочке.
+            event: Событие Telegram.
+            data: Данные, передаваемые в обработчик.
+
+        Returns:
+            Any: Результат работы обработчика.
+        """
+        data["service"] = self.service
+        return await handler(event, data)
@@ -10,14 +10,18 @@ from aiogram.utils.markdown import hbold
 
 from src.core import ProcessingStatus
 from src.core.logger import get_logger
+from src.core.schemas import AssociationType
 from src.core.validators import WordValidator
-from src.infrastructure.db import async_session_factory
-from src.infrastructure.repositories import DictionaryRepository, HistoryRepository
 from src.services.linguistic import LinguisticService
 
 router = Router()
 logger = get_logger(__name__)
 
+# Неизменяемые фрагменты ответа собираются один раз при импорте
+_RESULT_PREFIX = "Результат для: "
+_HBOLD_SYN = hbold("Синонимы")
+_HBOLD_ANT = hbold("Антонимы")
+
 
 @router.message(CommandStart())
 async def cmd_start(message: types.Message):
@@ -49,7 +53,7 @@ async def cmd_help(message: types.Message):
 
 
 @router.message(F.text)
-async def analyze_message_text(message: types.Message):
+async def analyze_message_text(message: types.Message, service: LinguisticService):
     """Обработка текстового сообщения как запроса на анализ.
 
     Выполняет поиск синонимов и антонимов для присланного слова, используя
@@ -57,24 +61,21 @@ async def analyze_message_text(message: types.Message):
 
     Args:
         message: Объект сообщения Telegram с текстом.
+        service: Лингвистический сервис (внедряется ServiceMiddleware).
     """
-    word = message.text.strip()
-    if not WordValidator.is_cyrillic(word):
+    word = WordValidator.normalize(message.text)
+    if not WordValidator.is_cyrillic_word(word):
         await message.answer("Пожалуйста, введите слово на кириллице без посторонних символов.")
         return
 
-    if len(word) > 50:
+    if WordValidator.is_too_long(word):
         await message.answer("Слишком длинное слово. Попробуйте что-то короче.")
         return
 
     status_msg = await message.answer(f"Анализирую слово {hbold(word)}...", parse_mode="HTML")
 
     try:
-        async with async_session_factory() as session:
-            dictionary_repo = DictionaryRepository(session)
-            history_repo = HistoryRepository(session)
-            service = LinguisticService(dictionary_repo, history_repo)
-            response = await service.analyze_word(word, source="telegram")
+        response = await service.analyze_word(word, source="telegram")
 
         if response["status"] == ProcessingStatus.FAILED:
             await status_msg.edit_text(f"Произошла ошибка: {response['error']}", parse_mode="HTML")
@@ -85,21 +86,19 @@ async def analyze_message_text(message: types.Message):
             await status_msg.edit_text("Ничего не найдено.", parse_mode="HTML")
             return
 
-        synonyms = list(dict.fromkeys([item.word for item in result if item.type == 'synonym']))
-        antonyms = list(dict.fromkeys([item.word for item in result if item.type == 'antonym']))
-
-        text_parts = [f"Результат для: {hbold(word)}\n"]
+        # Словари используются как упорядоченные множества: один проход, без дублей
+        synonyms: dict[str, None] = {}
+        antonyms: dict[str, None] = {}
+        for item in result:
+            (synonyms if item.type is AssociationType.SYNONYM else antonyms)[item.word] = None
 
+        chunks = [f"{_RESULT_PREFIX}{hbold(word)}\n"]
         if synonyms:
-            text_parts.append(f"✅ {hbold('Синонимы')}:")
-            text_parts.append(", ".join(synonyms))
-            text_parts.append("")
-
+            chunks.append(f"\n✅ {_HBOLD_SYN}:\n{', '.join(synonyms)}\n")
         if antonyms:
-            text_parts.append(f"❌ {hbold('Антонимы')}:")
-            text_parts.append(", ".join(antonyms))
+            chunks.append(f"\n❌ {_HBOLD_ANT}:\n{', '.join(antonyms)}")
 
-        await status_msg.edit_text("\n".join(text_parts), parse_mode="HTML")
+        await status_msg.edit_text("".join(chunks), parse_mode="HTML")
 
     except Exception as e:
         logger.error(
@@ -6,13 +6,21 @@
 
 import asyncio
 
+try:
+    import uvloop
+except ImportError:  # uvloop недоступен на Windows
+    uvloop = None
+
 from aiogram import Bot, Dispatcher, types
 from aiogram.utils.callback_answer import CallbackAnswerMiddleware
 
+from src.bot.di import ServiceMiddleware
 from src.bot.handlers import router
 from src.core import settings
 from src.core.exceptions import AppError
 from src.core.logger import get_logger, setup_logger
+from src.infrastructure.db import get_session_factory
+from src.services.linguistic import LinguisticService, close_http_client
 
 setup_logger()
 logger = get_logger(__name__)
@@ -28,8 +36,10 @@ async def main():
 
     bot = Bot(token=settings.TELEGRAM_BOT_TOKEN)
     dp = Dispatcher()
+    linguistic_service = LinguisticService(get_session_factory())
 
     dp.include_router(router)
+    dp.message.middleware(ServiceMiddleware(linguistic_service))
     dp.callback_query.middleware(CallbackAnswerMiddleware())
 
     @dp.errors()
@@ -51,35 +61,53 @@ async def main():
         elif update.callback_query:
             chat_id = update.callback_query.message.chat.id
 
-        log = logger.bind(
-            update_id=update.update_id,
-            error_type=type(exception).__name__,
-            chat_id=chat_id
-        )
+        update_id = update.update_id
+        error_type = type(exception).__name__
 
         if isinstance(exception, AppError):
-            log.warning("App error in bot", message=exception.message, code=exception.code)
+            logger.warning(
+                "App error in bot",
+                update_id=update_id,
+                error_type=error_type,
+                chat_id=chat_id,
+                message=exception.message,
+                code=exception.code,
+            )
             error_text = f"⚠ {exception.message}"
         else:
-            log.exception("Unhandled error in bot")
+            logger.exception(
+                "Unhandled error in bot",
+                update_id=update_id,
+                error_type=error_type,
+                chat_id=chat_id,
+            )
             error_text = "⚠ Произошла непредвиденная ошибка. Пожалуйста, попробуйте позже."
 
         if chat_id:
             try:
                 await bot.send_message(chat_id, error_text)
             except Exception as e:
-                log.error("Failed to send error message to user", send_error=str(e))
+                logger.error(
+                    "Failed to send error message to user",
+                    update_id=update_id,
+                    error_type=error_type,
+                    chat_id=chat_id,
+                    send_error=str(e),
+                )
 
     try:
         await bot.delete_webhook(drop_pending_updates=True)
         await dp.start_polling(bot)
     finally:
+        await linguistic_service.close()
+        await close_http_client()
         await bot.session.close()
 
 
 if __name__ == "__main__":
+    run = uvloop.run if uvloop is not None else asyncio.run
     try:
-        asyncio.run(main())
+        run(main())
     except (KeyboardInterrupt, SystemExit):
         logger.info("Bot stopped!")
 
@@ -4,6 +4,7 @@
 загрузки конфигурации из переменных окружения и .env файла.
 """
 
+from functools import cached_property
 from typing import Literal
 
 from pydantic import Field
@@ -16,8 +17,19 @@ class Settings(BaseSettings):
     Attributes:
         APP_ENV: Окружение (development, production, testing).
         LOG_LEVEL: Уровень логирования.
+        CORS_ORIGINS: Разрешенные источники для кросс-доменных запросов.
         DATABASE_URL: URL для подключения к базе данных.
+        DB_POOL_SIZE: Количество постоянных соединений в пуле.
+        DB_MAX_OVERFLOW: Количество дополнительных соединений сверх пула.
+        DB_POOL_TIMEOUT: Время ожидания свободного соединения (сек).
+        DB_POOL_RECYCLE: Время жизни соединения до переподключения (сек).
+        DB_POOL_USE_LIFO: Выдавать последнее возвращенное соединение (LIFO).
+        DB_QUERY_CACHE_SIZE: Размер LRU-кэша скомпилированных SQL-запросов.
         TELEGRAM_BOT_TOKEN: Токен Telegram-бота.
+        WORD_CACHE_SIZE: Размер in-memory кэша результатов анализа.
+        WORD_CACHE_TTL: Время жизни записи in-memory кэша (сек).
+        HISTORY_BATCH_SIZE: Максимальное число записей истории в одной пакетной вставке.
+        HISTORY_FLUSH_INTERVAL: Время накопления записей истории перед вставкой (сек).
     """
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -28,6 +40,7 @@ class Settings(BaseSettings):
     # App
     APP_ENV: Literal["development", "production", "testing"] = "development"
     LOG_LEVEL: str = "INFO"
+    CORS_ORIGINS: list[str] = []
 
     # Database
     DB_USER: str = "postgres"
@@ -36,11 +49,25 @@ class Settings(BaseSettings):
     DB_PORT: int = 5432
     DB_NAME: str = "lexicon"
     DATABASE_URL: str | None = None
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 30
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_USE_LIFO: bool = True
+    DB_QUERY_CACHE_SIZE: int = 1200
 
     # Ports
     APP_PORT: int = 8000
 
-    @property
+    # In-memory cache
+    WORD_CACHE_SIZE: int = 10_000
+    WORD_CACHE_TTL: float = 3600
+
+    # Request history batching
+    HISTORY_BATCH_SIZE: int = 500
+    HISTORY_FLUSH_INTERVAL: float = 0.1
+
+    @cached_property
     def assemble_database_url(self) -> str:
         """Сборка URL подключения к базе данных.
 
@@ -62,9 +89,12 @@ class Settings(BaseSettings):
     LLM_MAX_RETRIES: int = 2
     LLM_TIMEOUT: float = 60.0
 
-    @property
+    @cached_property
     def llm(self) -> "LLMProxy":
-        """Прокси для сохранения обратной совместимости с кодом, ожидающим settings.llm.attr."""
+        """Прокси для сохранения обратной совместимости с кодом, ожидающим settings.llm.attr.
+
+        Создается один раз при первом обращении.
+        """
         return LLMProxy(self)
 
 
@@ -8,6 +8,7 @@ import logging
 import sys
 from typing import Any
 
+import orjson
 import structlog
 from structlog.types import Processor
 
@@ -23,20 +24,24 @@ def setup_logger() -> None:
     processors: list[Processor] = [
         structlog.contextvars.merge_contextvars,
         structlog.processors.add_log_level,
-        structlog.processors.format_exc_info,
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
+        structlog.processors.TimeStamper(fmt="iso", utc=True),
     ]
 
     if settings.APP_ENV == "development":
+        # ConsoleRenderer сам форматирует исключения, format_exc_info здесь не нужен
+        processors.append(structlog.processors.StackInfoRenderer())
         processors.append(structlog.dev.ConsoleRenderer())
+        logger_factory = structlog.PrintLoggerFactory()
     else:
+        # dict_tracebacks работает только при наличии exc_info, обычные INFO-записи
+        # проходят минимальную цепочку и сериализуются через orjson
         processors.append(structlog.processors.dict_tracebacks)
-        processors.append(structlog.processors.JSONRenderer())
+        processors.append(structlog.processors.JSONRenderer(serializer=orjson.dumps))
+        logger_factory = structlog.BytesLoggerFactory()
 
     structlog.configure(
         processors=processors,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=logger_factory,
         wrapper_class=structlog.make_filtering_bound_logger(logging.getLevelName(settings.LOG_LEVEL)),
         cache_logger_on_first_use=True,
     )
@@ -63,13 +63,12 @@ class LinguisticRequestBase(BaseModel):
             v: Текст для проверки.
 
         Returns:
-            str: Проверенный текст.
+            str: Проверенное слово, уже нормализованное (WordValidator.normalize).
 
         Raises:
             ValueError: Если текст содержит некириллические символы.
         """
-        WordValidator.validate_word(v)
-        return v
+        return WordValidator.validate_word(v)
 
 
 class AssociationType(str, Enum):
@@ -85,8 +84,14 @@ class WordAssociation(BaseModel):
 
 
 class LinguisticResponse(BaseModel):
-    """Схема ответа на лингвистический запрос."""
-    request_id: UUID
+    """Схема ответа на лингвистический запрос.
+
+    Формируется только сервером из уже проверенных данных, поэтому в роутерах
+    создается через model_construct без повторной валидации.
+    """
+    model_config = ConfigDict(extra="forbid", frozen=False, validate_assignment=False)
+
+    request_id: UUID = Field(default_factory=uuid4)
     original_text: str
     request_type: RequestType = Field(default=RequestType.SYNONYM)
     status: ProcessingStatus
@@ -5,38 +5,116 @@
 """
 
 import re
+from functools import lru_cache
+
+# Максимальная длина слова (совпадает с размером колонки word_dictionary.word)
+MAX_WORD_LENGTH = 255
+
+# Допустимые символы: русский алфавит в обоих регистрах, дефис и любые пробельные
+# символы. Движок re компилирует такой класс символов в битовую карту, и проверка
+# каждого символа выполняется в C, без создания объектов str в цикле Python.
+_CYRILLIC_PATTERN = re.compile(r"[а-яёА-ЯЁ\s-]+")
+
+
+@lru_cache(maxsize=4096)
+def _is_cyrillic(word: str) -> bool:
+    """Кэшируемая проверка уже нормализованного слова.
+
+    Args:
+        word: Слово после strip() и lower().
+
+    Returns:
+        bool: True, если слово валидно, иначе False.
+    """
+    return _CYRILLIC_PATTERN.fullmatch(word) is not None
 
 
 class WordValidator:
     """Класс для валидации текстовых данных (слов)."""
 
-    _CYRILLIC_PATTERN = re.compile(r"^[а-яёА-ЯЁ\s-]+$")
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Приводит слово к каноническому виду (без пробелов по краям, в нижнем регистре).
 
-    @classmethod
-    def is_cyrillic(cls, text: str) -> bool:
+        Используется всеми точками входа (API, веб, бот), поэтому ключи кэшей
+        совпадают независимо от источника запроса. Результат не кэшируется:
+        на вход приходит текст произвольной длины, а хэширование ключа стоило
+        бы столько же, сколько сама нормализация.
+
+        Args:
+            text: Исходный текст.
+
+        Returns:
+            str: Нормализованное слово.
+        """
+        return text.strip().lower()
+
+    @staticmethod
+    def is_cyrillic(text: str) -> bool:
         """Проверяет, содержит ли текст только кириллицу, пробелы и дефисы.
 
+        Нормализует текст и вызывает is_cyrillic_word. Точки входа, которые уже
+        нормализовали слово, вызывают is_cyrillic_word напрямую.
+
         Args:
             text: Текст для проверки.
 
         Returns:
             bool: True, если текст валиден, иначе False.
         """
-        if not text:
-            return False
-        return bool(cls._CYRILLIC_PATTERN.match(text))
+        return WordValidator.is_cyrillic_word(WordValidator.normalize(text))
+
+    @staticmethod
+    def is_cyrillic_word(word: str) -> bool:
+        """Проверяет уже нормализованное слово на кириллицу, пробелы и дефисы.
+
+        Результат кэшируется по нормализованному слову, поэтому "Счастье"
+        и "счастье" используют одну запись кэша. ASCII-строки и строки длиннее
+        MAX_WORD_LENGTH проверяются без обращения к кэшу, чтобы не вытеснять
+        из него реальные слова. Длину слова проверяет is_too_long.
+
+        Args:
+            word: Слово после normalize().
+
+        Returns:
+            bool: True, если слово валидно, иначе False.
+        """
+        if word.isascii() or len(word) > MAX_WORD_LENGTH:
+            # Из ASCII допустимы только пробелы и дефисы
+            return _CYRILLIC_PATTERN.fullmatch(word) is not None
+        return _is_cyrillic(word)
+
+    @staticmethod
+    def is_too_long(word: str) -> bool:
+        """Проверяет, превышает ли нормализованное слово MAX_WORD_LENGTH.
+
+        Args:
+            word: Слово после normalize().
+
+        Returns:
+            bool: True, если слово слишком длинное, иначе False.
+        """
+        return len(word) > MAX_WORD_LENGTH
 
     @classmethod
-    def validate_word(cls, text: str) -> None:
-        """Валидирует текст и выбрасывает исключение при ошибке.
+    def validate_word(cls, text: str) -> str:
+        """Нормализует и валидирует текст, выбрасывая исключение при ошибке.
 
         Args:
             text: Текст для проверки.
 
+        Returns:
+            str: Нормализованное слово.
+
         Raises:
-            ValueError: Если текст содержит некириллические символы.
+            ValueError: Если текст содержит некириллические символы или
+                слишком длинный.
         """
-        if not cls.is_cyrillic(text):
+        word = cls.normalize(text)
+        if not cls.is_cyrillic_word(word):
             raise ValueError(
                 "Текст должен содержать только кириллические символы, пробелы или дефисы"
             )
+        if cls.is_too_long(word):
+            raise ValueError(f"Слово должно быть не длиннее {MAX_WORD_LENGTH} символов")
+        return word
@@ -1,12 +1,12 @@
 """Пакет для работы с базой данных."""
 
-from src.infrastructure.db.base import Base, async_session_factory, engine, get_db
+from src.infrastructure.db.base import Base, get_db, get_engine, get_session_factory
 from src.infrastructure.db.models import RequestHistory, User, WordDictionary
 
 __all__ = [
     "Base",
-    "engine",
-    "async_session_factory",
+    "get_engine",
+    "get_session_factory",
     "get_db",
     "User",
     "RequestHistory",
@@ -1,12 +1,15 @@
 """Конфигурация базы данных.
 
-Этот модуль настраивает SQLAlchemy: создает асинхронный движок, фабрику сессий
-и определяет базовый класс для моделей.
+Этот модуль настраивает SQLAlchemy: предоставляет асинхронный движок и фабрику
+сессий (создаются при первом обращении) и определяет базовый класс для моделей.
 """
 
-from typing import AsyncGenerator
+from functools import lru_cache
+from typing import Any, AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import orjson
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
 from src.core import settings
@@ -17,18 +20,79 @@ class Base(DeclarativeBase):
     pass
 
 
-engine = create_async_engine(
-    settings.assemble_database_url,
-    echo=settings.LOG_LEVEL == "DEBUG",
-    future=True,
-)
+def _json_serializer(value: Any) -> str:
+    """Сериализует значения колонок JSON/JSONB через orjson.
 
-async_session_factory = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autoflush=False,
-)
+    Args:
+        value: Значение для сериализации.
+
+    Returns:
+        str: JSON-строка.
+    """
+    return orjson.dumps(value).decode()
+
+
+# Параметры подключения asyncpg: JIT отключен, потому что на коротких запросах
+# (и на служебных запросах интроспекции типов asyncpg) компиляция стоит дороже
+# самого запроса; подготовленные выражения кэшируются на каждом соединении.
+_ASYNCPG_CONNECT_ARGS = {
+    "server_settings": {
+        "jit": "off",
+        "application_name": "lexicon",
+        "timezone": "UTC",
+    },
+    "statement_cache_size": 1024,
+    "prepared_statement_cache_size": 200,
+}
+
+@lru_cache(maxsize=1)
+def get_engine() -> AsyncEngine:
+    """Возвращает асинхронный движок приложения.
+
+    Движок создается при первом вызове, а не при импорте модуля, и затем
+    переиспользуется всеми запросами. В режиме LIFO пул чаще отдает недавно
+    использованные соединения, поэтому при невысокой нагрузке работает небольшое
+    «горячее» подмножество. Кэш скомпилированных запросов увеличен, чтобы горячие
+    запросы не вытеснялись. JSONB (ассоциации слов) сериализуется и разбирается
+    через orjson.
+
+    Returns:
+        AsyncEngine: Движок SQLAlchemy.
+    """
+    url = make_url(settings.assemble_database_url)
+    # Параметры пула передаются всегда, поэтому движок без пула (NullPool,
+    # допустимый только в migrations/env.py) здесь создать нельзя: SQLAlchemy
+    # отклонит pool_size для NullPool.
+    return create_async_engine(
+        url,
+        echo=settings.LOG_LEVEL == "DEBUG",
+        future=True,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=True,
+        pool_use_lifo=settings.DB_POOL_USE_LIFO,
+        query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads,
+        connect_args=_ASYNCPG_CONNECT_ARGS if url.get_driver_name() == "asyncpg" else {},
+    )
+
+
+@lru_cache(maxsize=1)
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Возвращает фабрику сессий, привязанную к движку приложения.
+
+    Returns:
+        async_sessionmaker[AsyncSession]: Фабрика асинхронных сессий.
+    """
+    return async_sessionmaker(
+        get_engine(),
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autoflush=False,
+    )
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -37,6 +101,6 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     Yields:
         AsyncSession: Экземпляр сессии SQLAlchemy.
     """
-    async with async_session_factory() as session:
+    async with get_session_factory()() as session:
         yield session
 
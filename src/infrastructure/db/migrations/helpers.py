@@ -0,0 +1,100 @@
+"""Вспомогательные функции для миграций данных.
+
+Этот модуль содержит утилиты для миграций, которые изменяют большие объемы данных:
+обработка таблицы диапазонами ключей позволяет не держать всю выборку в памяти
+и не блокировать таблицу одной длинной командой.
+"""
+
+from typing import Any, Iterator, Optional, Tuple
+
+from sqlalchemy import BigInteger, Column, bindparam, column, func, select, table
+from sqlalchemy.engine import Connection
+
+from src.infrastructure.db.models import text_hash
+
+# Облегченное описание таблицы: миграция не зависит от текущего состояния моделей
+_request_history = table(
+    "request_history",
+    column("id"),
+    column("original_text"),
+    column("text_hash", BigInteger),
+)
+
+
+def batch_by_row_number(
+    connection: Connection, column: Column, chunk_size: int = 10_000
+) -> Iterator[Tuple[Any, Optional[Any]]]:
+    """Разбивает таблицу на последовательные диапазоны по значению столбца.
+
+    Границы вычисляются одним запросом с row_number(): берется каждое
+    chunk_size-е значение отсортированного столбца. Каждый диапазон затем
+    обрабатывается отдельной командой вида
+    ``UPDATE ... WHERE column >= lower AND (upper IS NULL OR column < upper)``.
+
+    Пример использования в upgrade()::
+
+        for lower, upper in batch_by_row_number(op.get_bind(), table.c.id):
+            condition = table.c.id >= lower
+            if upper is not None:
+                condition &= table.c.id < upper
+            op.execute(table.update().where(condition).values(...))
+
+    Args:
+        connection: Синхронное соединение миграции (op.get_bind()).
+        column: Столбец с уникальными упорядочиваемыми значениями (обычно первичный ключ).
+        chunk_size: Количество строк в одном диапазоне.
+
+    Yields:
+        Tuple[Any, Optional[Any]]: Нижняя граница (включительно) и верхняя граница
+        (не включительно) диапазона; у последнего диапазона верхняя граница None.
+    """
+    numbered = select(
+        column.label("key"),
+        func.row_number().over(order_by=column).label("rn"),
+    ).subquery()
+    stmt = (
+        select(numbered.c.key)
+        .where((numbered.c.rn - 1) % chunk_size == 0)
+        .order_by(numbered.c.key)
+    )
+    bounds = connection.execute(stmt).scalars().all()
+    for index, lower in enumerate(bounds):
+        upper = bounds[index + 1] if index + 1 < len(bounds) else None
+        yield lower, upper
+
+
+def backfill_text_hash(connection: Connection, chunk_size: int = 10_000) -> None:
+    """Заполняет request_history.text_hash у записей, созданных до появления колонки.
+
+    Хэш (blake2b) вычисляется в Python функцией text_hash, поэтому его нельзя
+    заполнить одним UPDATE на стороне БД. Таблица обрабатывается диапазонами
+    первичного ключа (см. batch_by_row_number), уже заполненные строки пропускаются.
+
+    Пример использования в upgrade()::
+
+        op.add_column("request_history", sa.Column("text_hash", sa.BigInteger(), nullable=True))
+        backfill_text_hash(op.get_bind())
+        op.alter_column("request_history", "text_hash", nullable=False)
+
+    Args:
+        connection: Синхронное соединение миграции (op.get_bind()).
+        chunk_size: Количество строк в одном диапазоне.
+    """
+    history = _request_history
+    update_stmt = (
+        history.update()
+        .where(history.c.id == bindparam("row_id"))
+        .values(text_hash=bindparam("row_hash"))
+    )
+    for lower, upper in batch_by_row_number(connection, history.c.id, chunk_size):
+        condition = (history.c.id >= lower) & history.c.text_hash.is_(None)
+        if upper is not None:
+            condition &= history.c.id < upper
+        rows = connection.execute(
+            select(history.c.id, history.c.original_text).where(condition)
+        ).all()
+        if rows:
+            connection.execute(
+                update_stmt,
+                [{"row_id": row.id, "row_hash": text_hash(row.original_text)} for row in rows],
+            )
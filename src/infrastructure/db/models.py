@@ -4,17 +4,62 @@
 истории запросов и кэша лингвистического словаря.
 """
 
+import hashlib
+import os
+import time
 import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import BigInteger, DateTime, String, Uuid, func
+from sqlalchemy import BigInteger, CheckConstraint, DateTime, Index, String, Uuid, func
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.engine.default import DefaultExecutionContext
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.infrastructure.db.base import Base
 
 
+def _uuid7() -> uuid.UUID:
+    """Генерирует UUID версии 7 (RFC 9562).
+
+    Первые 48 бит — время в миллисекундах, поэтому новые ключи растут
+    монотонно и вставляются в конец B-дерева индекса, а не в случайные страницы.
+
+    Returns:
+        uuid.UUID: Новый идентификатор.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = int.from_bytes(timestamp_ms.to_bytes(6, "big") + os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # версия 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # вариант RFC 9562
+    return uuid.UUID(int=value)
+
+
+def text_hash(text: str) -> int:
+    """Вычисляет 64-битный хэш текста для хранения в колонке BIGINT.
+
+    Args:
+        text: Исходный текст.
+
+    Returns:
+        int: Знаковое 64-битное целое.
+    """
+    digest = hashlib.blake2b(text.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+def _default_text_hash(context: DefaultExecutionContext) -> int:
+    """Значение по умолчанию для RequestHistory.text_hash.
+
+    Args:
+        context: Контекст выполнения INSERT.
+
+    Returns:
+        int: Хэш поля original_text вставляемой строки.
+    """
+    return text_hash(context.get_current_parameters()["original_text"])
+
+
 class User(Base):
     """Модель пользователя.
 
@@ -23,7 +68,7 @@ class User(Base):
     __tablename__ = "users"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4
+        Uuid(as_uuid=True), primary_key=True, default=_uuid7
     )
     telegram_id: Mapped[int] = mapped_column(BigInteger, unique=True, index=True)
     username: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
@@ -38,15 +83,23 @@ class RequestHistory(Base):
     """Модель истории запросов.
 
     Хранит записи о выполненных запросах на анализ текста из различных источников.
+    Поле text_hash заполняется автоматически и позволяет искать записи по тексту
+    через компактный индекс фиксированной ширины.
     """
     __tablename__ = "request_history"
+    __table_args__ = (
+        # Индекс для постраничного вывода истории пользователя (keyset-пагинация);
+        # также обслуживает поиск по одному user_id
+        Index("ix_request_history_user_created", "user_id", "created_at", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
-        Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4
+        Uuid(as_uuid=True), primary_key=True, default=_uuid7
     )
-    user_id: Mapped[Optional[uuid.UUID]] = mapped_column(Uuid(as_uuid=True), index=True, nullable=True)
+    user_id: Mapped[Optional[uuid.UUID]] = mapped_column(Uuid(as_uuid=True), nullable=True)
     source: Mapped[str] = mapped_column(String(50), default="web") # web, telegram, api
-    original_text: Mapped[str] = mapped_column(String)
+    original_text: Mapped[str] = mapped_column(String(255))
+    text_hash: Mapped[int] = mapped_column(BigInteger, index=True, default=_default_text_hash)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
@@ -56,11 +109,16 @@ class WordDictionary(Base):
     """Модель словаря (кэша).
 
     Хранит результаты анализа слов для предотвращения повторных обращений к LLM.
+    Слова хранятся только в нижнем регистре (см. WordValidator.normalize), поэтому
+    поиск по уникальному индексу не пропускает записи, отличающиеся регистром.
     """
     __tablename__ = "word_dictionary"
+    __table_args__ = (
+        CheckConstraint("word = lower(word)", name="ck_word_dictionary_word_lower"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
-        Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4
+        Uuid(as_uuid=True), primary_key=True, default=_uuid7
     )
     word: Mapped[str] = mapped_column(String(255), unique=True, index=True)
     associations: Mapped[dict] = mapped_column(JSONB)
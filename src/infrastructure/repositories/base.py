@@ -4,10 +4,10 @@
 обеспечивая стандартные операции CRUD через SQLAlchemy.
 """
 
-from typing import Generic, List, Optional, Type, TypeVar
+from typing import Any, AsyncIterator, Generic, List, Optional, Sequence, Type, TypeVar
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Select, insert, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -22,7 +22,10 @@ ModelType = TypeVar("ModelType", bound=Base)
 class BaseRepository(Generic[ModelType]):
     """Базовый асинхронный репозиторий.
 
-    Предоставляет общие методы для работы с моделями БД.
+    Предоставляет общие методы для работы с моделями БД. Сессии создаются
+    с autoflush=False и expire_on_commit=False, поэтому чтение не вызывает
+    неявный flush: изменения, которые должны быть видны запросу, нужно
+    записать (flush/commit) до него.
 
     Attributes:
         model: Класс модели SQLAlchemy, с которой работает репозиторий.
@@ -44,29 +47,67 @@ class BaseRepository(Generic[ModelType]):
     async def get(self, id: UUID) -> Optional[ModelType]:
         """Получает одну запись по её ID.
 
+        Сначала проверяет identity map сессии и обращается к БД, только если
+        объект еще не загружен.
+
         Args:
             id: Уникальный идентификатор записи.
 
         Returns:
             Optional[ModelType]: Найденная модель или None.
         """
-        stmt = select(self.model).where(self.model.id == id)
-        result = await self.session.execute(stmt)
-        return result.scalars().first()
+        return await self.session.get(self.model, id)
+
+    def _select(self, columns: Optional[Sequence[Any]] = None) -> Select:
+        """Строит SELECT по модели целиком или по отдельным столбцам.
+
+        Args:
+            columns: Столбцы модели для выборки. Если не заданы, выбираются объекты модели.
+
+        Returns:
+            Select: Запрос без условий.
+        """
+        return select(*columns) if columns else select(self.model)
 
-    async def get_all(self, skip: int = 0, limit: int = 100) -> List[ModelType]:
+    async def get_all(
+        self, skip: int = 0, limit: int = 100, columns: Optional[Sequence[Any]] = None
+    ) -> List[Any]:
         """Получает список всех записей с поддержкой пагинации.
 
         Args:
             skip: Количество пропускаемых записей.
             limit: Максимальное количество возвращаемых записей.
+            columns: Столбцы для выборки. Если заданы, возвращаются кортежи значений
+                без создания ORM-объектов и регистрации их в сессии.
 
         Returns:
-            List[ModelType]: Список найденных моделей.
+            List[Any]: Список найденных моделей или кортежей значений.
         """
-        stmt = select(self.model).offset(skip).limit(limit)
+        stmt = self._select(columns).offset(skip).limit(limit)
         result = await self.session.execute(stmt)
-        return result.scalars().all()
+        return result.all() if columns else result.scalars().all()
+
+    async def stream_all(
+        self, columns: Optional[Sequence[Any]] = None, batch_size: int = 200
+    ) -> AsyncIterator[Any]:
+        """Последовательно выдает все записи, загружая их пачками.
+
+        Используется для обхода больших таблиц: в памяти одновременно
+        находится не больше batch_size строк.
+
+        Args:
+            columns: Столбцы для выборки. Если заданы, выдаются кортежи значений.
+            batch_size: Количество строк, загружаемых за один раз.
+
+        Yields:
+            Any: Экземпляр модели или кортеж значений.
+        """
+        stmt = self._select(columns).execution_options(yield_per=batch_size)
+        result = await self.session.stream(stmt)
+        if not columns:
+            result = result.scalars()
+        async for item in result:
+            yield item
 
     async def create(self, **kwargs) -> ModelType:
         """Создает и сохраняет новую запись в БД.
@@ -81,10 +122,12 @@ class BaseRepository(Generic[ModelType]):
             DatabaseError: При ошибке на стороне базы данных.
         """
         try:
-            instance = self.model(**kwargs)
-            self.session.add(instance)
+            # INSERT ... RETURNING сразу возвращает серверные значения по умолчанию
+            # (id, created_at), поэтому повторный SELECT через refresh не нужен
+            stmt = insert(self.model).values(**kwargs).returning(self.model)
+            result = await self.session.execute(stmt)
+            instance = result.scalar_one()
             await self.session.commit()
-            await self.session.refresh(instance)
             self.logger.info("Created instance", **kwargs)
             return instance
         except SQLAlchemyError as e:
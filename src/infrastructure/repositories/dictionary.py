@@ -6,7 +6,7 @@
 
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -15,6 +15,19 @@ from src.core.exceptions import DatabaseError
 from src.infrastructure.db import WordDictionary
 from src.infrastructure.repositories.base import BaseRepository
 
+_GET_BY_WORD_STMT = select(WordDictionary).where(WordDictionary.word == bindparam("word"))
+
+# Запрос upsert собирается один раз при импорте: при каждом вызове меняются
+# только значения параметров, а скомпилированный SQL берется из кэша движка.
+_insert = insert(WordDictionary).values(
+    word=bindparam("word"),
+    associations=bindparam("associations", type_=WordDictionary.associations.type),
+)
+_UPSERT_STMT = _insert.on_conflict_do_update(
+    index_elements=[WordDictionary.word],
+    set_={"associations": _insert.excluded.associations},
+).returning(WordDictionary)
+
 
 class DictionaryRepository(BaseRepository[WordDictionary]):
     """Репозиторий для управления кэшем слов и их ассоциаций.
@@ -39,9 +52,8 @@ class DictionaryRepository(BaseRepository[WordDictionary]):
         Returns:
             Optional[WordDictionary]: Найденная запись или None.
         """
-        stmt = select(self.model).where(self.model.word == word)
-        result = await self.session.execute(stmt)
-        return result.scalars().first()
+        result = await self.session.execute(_GET_BY_WORD_STMT, {"word": word})
+        return result.scalar_one_or_none()
 
     async def upsert(self, word: str, associations: dict) -> WordDictionary:
         """Создает новую запись или обновляет существующую, если слово уже есть.
@@ -57,18 +69,11 @@ class DictionaryRepository(BaseRepository[WordDictionary]):
             DatabaseError: При ошибке выполнения операции в базе данных.
         """
         try:
-            stmt = (
-                insert(self.model)
-                .values(word=word, associations=associations)
-                .on_conflict_do_update(
-                    index_elements=[self.model.word],
-                    set_={"associations": associations},
-                )
-                .returning(self.model)
+            result = await self.session.execute(
+                _UPSERT_STMT, {"word": word, "associations": associations}
             )
-            result = await self.session.execute(stmt)
-            await self.session.commit()
             instance = result.scalars().one()
+            await self.session.commit()
             self.logger.info("Upserted word", word=word)
             return instance
         except SQLAlchemyError as e:
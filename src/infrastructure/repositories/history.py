@@ -4,15 +4,51 @@
 запросов пользователей.
 """
 
-from typing import List
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, insert, select, tuple_
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.exceptions import DatabaseError
 from src.infrastructure.db import RequestHistory
+from src.infrastructure.db.models import text_hash
 from src.infrastructure.repositories.base import BaseRepository
 
+# Курсор страницы истории: дата создания и ID последней записи
+HistoryCursor = Tuple[datetime, UUID]
+
+# Запросы собираются один раз при импорте; лимит и смещение тоже передаются
+# параметрами, поэтому любой вызов использует один и тот же скомпилированный SQL.
+# Записи одной пакетной вставки имеют одинаковый created_at, поэтому порядок
+# и курсор дополнительно учитывают id.
+_GET_BY_USER_STMT = (
+    select(RequestHistory)
+    .where(RequestHistory.user_id == bindparam("user_id"))
+    .order_by(RequestHistory.created_at.desc(), RequestHistory.id.desc())
+    .limit(bindparam("limit"))
+)
+_GET_BY_USER_AFTER_STMT = _GET_BY_USER_STMT.where(
+    tuple_(RequestHistory.created_at, RequestHistory.id)
+    < tuple_(
+        bindparam("cursor_created_at", type_=RequestHistory.created_at.type),
+        bindparam("cursor_id", type_=RequestHistory.id.type),
+    )
+)
+_GET_BY_USER_AND_TEXT_STMT = (
+    select(RequestHistory)
+    .where(
+        RequestHistory.user_id == bindparam("user_id"),
+        RequestHistory.text_hash == bindparam("text_hash"),
+        RequestHistory.original_text == bindparam("text"),
+    )
+    .order_by(RequestHistory.created_at.desc())
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+
 
 class HistoryRepository(BaseRepository[RequestHistory]):
     """Репозиторий для управления историей запросов.
@@ -28,26 +64,90 @@ class HistoryRepository(BaseRepository[RequestHistory]):
         """
         super().__init__(RequestHistory, session)
 
+    async def create_many(self, rows: List[Dict[str, Any]]) -> None:
+        """Сохраняет несколько записей истории одним пакетным INSERT.
+
+        Args:
+            rows: Список словарей с полями записей.
+
+        Raises:
+            DatabaseError: При ошибке на стороне базы данных.
+        """
+        try:
+            await self.session.execute(insert(self.model), rows)
+            await self.session.commit()
+            self.logger.info("Created instances", count=len(rows))
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            self.logger.error("Failed to create instances", count=len(rows), error=str(e))
+            raise DatabaseError(message="Ошибка при сохранении истории в БД", details={"error": str(e)}) from e
+
     async def get_by_user_id(
-        self, user_id: UUID, skip: int = 0, limit: int = 100
+        self,
+        user_id: UUID,
+        cursor: Optional[HistoryCursor] = None,
+        limit: int = 100,
+    ) -> Tuple[List[RequestHistory], Optional[HistoryCursor]]:
+        """Получает страницу истории запросов конкретного пользователя.
+
+        Используется keyset-пагинация: следующая страница начинается сразу после
+        последней записи предыдущей, поэтому стоимость запроса не зависит от
+        номера страницы (в отличие от OFFSET).
+
+        Args:
+            user_id: ID пользователя.
+            cursor: Курсор, полученный вместе с предыдущей страницей. None — первая страница.
+            limit: Максимальное количество возвращаемых записей.
+
+        Returns:
+            Tuple[List[RequestHistory], Optional[HistoryCursor]]: Записи истории,
+            отсортированные по дате создания (сначала новые), и курсор следующей
+            страницы (None, если страница последняя).
+        """
+        if cursor is None:
+            result = await self.session.execute(
+                _GET_BY_USER_STMT, {"user_id": user_id, "limit": limit}
+            )
+        else:
+            created_at, last_id = cursor
+            result = await self.session.execute(
+                _GET_BY_USER_AFTER_STMT,
+                {
+                    "user_id": user_id,
+                    "limit": limit,
+                    "cursor_created_at": created_at,
+                    "cursor_id": last_id,
+                },
+            )
+        rows = result.scalars().all()
+        next_cursor = (rows[-1].created_at, rows[-1].id) if len(rows) == limit else None
+        return rows, next_cursor
+
+    async def get_by_user_and_text(
+        self, user_id: UUID, text: str, skip: int = 0, limit: int = 100
     ) -> List[RequestHistory]:
-        """Получает историю запросов конкретного пользователя.
+        """Получает запросы пользователя с конкретным текстом.
+
+        Поиск идет по индексу хэша текста, а совпадение самого текста
+        дополнительно проверяется, чтобы исключить коллизии хэша.
 
         Args:
             user_id: ID пользователя.
+            text: Текст запроса (нормализованное слово).
             skip: Количество пропускаемых записей.
             limit: Максимальное количество возвращаемых записей.
 
         Returns:
             List[RequestHistory]: Список записей истории, отсортированный по дате создания (сначала новые).
         """
-        stmt = (
-            select(self.model)
-            .where(self.model.user_id == user_id)
-            .order_by(self.model.created_at.desc())
-            .offset(skip)
-            .limit(limit)
+        result = await self.session.execute(
+            _GET_BY_USER_AND_TEXT_STMT,
+            {
+                "user_id": user_id,
+                "text_hash": text_hash(text),
+                "text": text,
+                "skip": skip,
+                "limit": limit,
+            },
         )
-        result = await self.session.execute(stmt)
         return result.scalars().all()
-
@@ -6,12 +6,14 @@
 
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.infrastructure.db import User
 from src.infrastructure.repositories.base import BaseRepository
 
+_GET_BY_TELEGRAM_ID_STMT = select(User).where(User.telegram_id == bindparam("telegram_id"))
+
 
 class UserRepository(BaseRepository[User]):
     """Репозиторий для управления информацией о пользователях.
@@ -36,7 +38,8 @@ class UserRepository(BaseRepository[User]):
         Returns:
             Optional[User]: Найденный пользователь или None.
         """
-        stmt = select(self.model).where(self.model.telegram_id == telegram_id)
-        result = await self.session.execute(stmt)
-        return result.scalars().first()
+        result = await self.session.execute(
+            _GET_BY_TELEGRAM_ID_STMT, {"telegram_id": telegram_id}
+        )
+        return result.scalar_one_or_none()
 
@@ -1,5 +1,6 @@
 """Пакет лингвистического сервиса."""
 
+from src.services.linguistic.chains import close_http_client
 from src.services.linguistic.service import LinguisticService
 
-__all__ = ["LinguisticService"]
+__all__ = ["LinguisticService", "close_http_client"]
@@ -6,6 +6,7 @@
 
 from typing import List
 
+import httpx
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
 from pydantic import BaseModel, Field
@@ -25,6 +26,18 @@ class AnalysisResponse(BaseModel):
     antonyms: List[str] = Field(description="List of 5 antonyms (empty if word not exists).")
 
 
+# Общий HTTP-клиент для всех обращений к LLM: соединения (TCP + TLS) живут
+# между запросами, а HTTP/2 мультиплексирует одновременные запросы в одном соединении
+http_client = httpx.AsyncClient(
+    http2=True,
+    limits=httpx.Limits(
+        max_connections=200,
+        max_keepalive_connections=100,
+        keepalive_expiry=60,
+    ),
+    timeout=settings.llm.TIMEOUT,
+)
+
 llm = ChatOpenAI(
     base_url=settings.llm.BASE_URL,
     api_key=settings.llm.API_KEY,
@@ -32,6 +45,7 @@ llm = ChatOpenAI(
     temperature=settings.llm.TEMPERATURE,
     max_retries=settings.llm.MAX_RETRIES,
     timeout=settings.llm.TIMEOUT,
+    http_async_client=http_client,
 )
 
 structured_llm = llm.with_structured_output(AnalysisResponse, method="json_mode")
@@ -110,3 +124,9 @@ async def analyze_word(word: str) -> List[WordAssociation]:
         ) from e
 
 
+async def close_http_client() -> None:
+    """Закрывает общий HTTP-клиент LLM.
+
+    Вызывается при остановке приложения или бота.
+    """
+    await http_client.aclose()
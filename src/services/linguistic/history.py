@@ -0,0 +1,121 @@
+"""Фоновая запись истории запросов.
+
+Этот модуль содержит буфер, который накапливает записи истории в очереди
+и сохраняет их в БД пакетами, чтобы обработка запроса не ждала отдельного
+INSERT и COMMIT на каждую запись.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core import settings
+from src.core.logger import get_logger
+from src.infrastructure.repositories import HistoryRepository
+
+logger = get_logger(__name__)
+
+# Очередь вмещает несколько пачек: этого хватает на всплеск запросов, но при
+# недоступной БД память процесса не растет без ограничений
+_MAX_PENDING_BATCHES = 4
+
+
+class HistoryWriter:
+    """Буфер истории запросов с пакетной записью в БД.
+
+    Записи попадают в очередь через enqueue, а фоновая задача забирает их
+    пачками до batch_size штук (ожидая до flush_interval секунд) и сохраняет
+    одним INSERT. История носит вспомогательный характер, поэтому пачка,
+    которую не удалось сохранить, логируется и отбрасывается, а при
+    переполненной очереди отбрасываются новые записи.
+
+    Attributes:
+        session_factory: Фабрика асинхронных сессий базы данных.
+        batch_size: Максимальный размер пачки.
+        flush_interval: Время накопления пачки (сек).
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        batch_size: int = settings.HISTORY_BATCH_SIZE,
+        flush_interval: float = settings.HISTORY_FLUSH_INTERVAL,
+        max_pending: Optional[int] = None,
+    ):
+        """Инициализирует буфер истории.
+
+        Args:
+            session_factory: Фабрика асинхронных сессий базы данных.
+            batch_size: Максимальный размер пачки.
+            flush_interval: Время накопления пачки (сек).
+            max_pending: Максимальное число записей в очереди. По умолчанию
+                несколько пачек (batch_size * _MAX_PENDING_BATCHES).
+        """
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        if max_pending is None:
+            max_pending = batch_size * _MAX_PENDING_BATCHES
+        self._queue: asyncio.Queue[Optional[Dict[str, Any]]] = asyncio.Queue(maxsize=max_pending)
+        self._task: Optional[asyncio.Task] = None
+
+    def enqueue(self, **kwargs) -> None:
+        """Добавляет запись истории в очередь на сохранение.
+
+        Фоновая задача запускается при первом вызове. Если очередь заполнена
+        (например, БД недоступна), запись отбрасывается с предупреждением.
+
+        Args:
+            **kwargs: Поля записи RequestHistory.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        try:
+            self._queue.put_nowait(kwargs)
+        except asyncio.QueueFull:
+            logger.warning("Request history queue is full, dropping row", source=kwargs.get("source"))
+
+    async def close(self) -> None:
+        """Сохраняет все накопленные записи и останавливает фоновую задачу."""
+        if self._task is None:
+            return
+        # None в очереди — сигнал завершения после записи предыдущих элементов;
+        # при заполненной очереди ждем, пока фоновая задача освободит место
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        """Цикл фоновой задачи: собирает пачки из очереди и сохраняет их."""
+        while True:
+            row = await self._queue.get()
+            if row is None:
+                return
+            batch = [row]
+            if self._queue.qsize() < self.batch_size:
+                await asyncio.sleep(self.flush_interval)
+
+            stop = False
+            while len(batch) < self.batch_size and not self._queue.empty():
+                row = self._queue.get_nowait()
+                if row is None:
+                    stop = True
+                    break
+                batch.append(row)
+
+            await self._flush(batch)
+            if stop:
+                return
+
+    async def _flush(self, batch: List[Dict[str, Any]]) -> None:
+        """Сохраняет пачку записей истории.
+
+        Args:
+            batch: Список записей для сохранения.
+        """
+        try:
+            async with self.session_factory() as session:
+                await HistoryRepository(session).create_many(batch)
+        except Exception:
+            logger.exception("Failed to flush request history", count=len(batch))
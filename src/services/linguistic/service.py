@@ -4,13 +4,19 @@
 включая взаимодействие с репозиториями и графом AI.
 """
 
-from typing import Any, Dict
+import asyncio
+from functools import partial
+from typing import Any, Dict, List
 
-from src.core import ProcessingStatus, WordAssociation
+from cachetools import TTLCache
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core import ProcessingStatus, WordAssociation, settings
 from src.core.exceptions import AppError
 from src.core.logger import get_logger
-from src.infrastructure.repositories import DictionaryRepository, HistoryRepository
+from src.infrastructure.repositories import DictionaryRepository
 from src.services.linguistic.graph import app_graph
+from src.services.linguistic.history import HistoryWriter
 
 logger = get_logger(__name__)
 
@@ -19,39 +25,46 @@ class LinguisticService:
     """Сервис для выполнения лингвистических операций.
 
     Оркестрирует процесс анализа слова: поиск в кэше, вызов AI и сохранение истории.
+    Один экземпляр используется всеми обработчиками: сессия БД открывается
+    только внутри вызова analyze_word, а между запросами сохраняется лишь
+    in-memory кэш результатов. История запросов пишется в фоне пакетами.
 
     Attributes:
-        dictionary_repo: Репозиторий для работы с кэшем слов.
-        history_repo: Репозиторий для сохранения истории запросов.
+        session_factory: Фабрика асинхронных сессий базы данных.
+        history: Буфер пакетной записи истории запросов.
         logger: Логгер сервиса.
     """
 
-    def __init__(
-        self,
-        dictionary_repo: DictionaryRepository,
-        history_repo: HistoryRepository,
-    ):
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
         """Инициализирует лингвистический сервис.
 
         Args:
-            dictionary_repo: Репозиторий словаря.
-            history_repo: Репозиторий истории.
+            session_factory: Фабрика асинхронных сессий базы данных.
         """
-        self.dictionary_repo = dictionary_repo
-        self.history_repo = history_repo
+        self.session_factory = session_factory
+        self.history = HistoryWriter(session_factory)
         self.logger = logger
+        # Ассоциации слов практически неизменны, поэтому кэш сбрасывается только по TTL
+        self._cache: TTLCache[str, List[WordAssociation]] = TTLCache(
+            maxsize=settings.WORD_CACHE_SIZE,
+            ttl=settings.WORD_CACHE_TTL,
+        )
+        self._inflight: Dict[str, asyncio.Task] = {}
 
     async def analyze_word(self, word: str, source: str = "web") -> Dict[str, Any]:
         """Проводит полный анализ слова.
 
         Алгоритм работы:
-        1. Проверяет наличие слова в кэше (БД).
+        1. Проверяет наличие слова в памяти процесса, затем в кэше (БД).
         2. При отсутствии в кэше — вызывает AI-граф для генерации ассоциаций.
         3. Сохраняет полученный результат в кэш.
-        4. Создает запись в истории запросов.
+        4. Ставит запись в истории запросов в очередь на пакетное сохранение.
+
+        Слово не нормализуется повторно: все точки входа (API, веб, бот)
+        уже привели его к виду WordValidator.normalize и проверили.
 
         Args:
-            word: Слово для анализа.
+            word: Нормализованное слово для анализа.
             source: Источник запроса (web, telegram, api).
 
         Returns:
@@ -60,58 +73,25 @@ class LinguisticService:
                 - error: Сообщение об ошибке или None.
                 - status: Статус обработки (ProcessingStatus).
         """
-        word = word.strip().lower()
         log = self.logger.bind(word=word, source=source)
         log.info("Starting word analysis")
 
         try:
-            # 1. Проверка кэша
-            cached_entry = await self.dictionary_repo.get_by_word(word)
-            if cached_entry:
-                log.info("Cache hit for word")
-                associations_data = cached_entry.associations.get("items", [])
-                associations = [WordAssociation(**item) for item in associations_data]
-
-                await self.history_repo.create(
-                    source=source,
-                    original_text=word,
-                )
-
-                return {
-                    "result": associations,
-                    "error": None,
-                    "status": ProcessingStatus.COMPLETED
-                }
-
-            # 2. Запрос к AI
-            log.info("Cache miss, calling AI graph")
-            inputs = {"word": word, "result": None, "error": None}
-            result_state = await app_graph.ainvoke(inputs)
-
-            result_data = result_state.get("result")
-            error_data = result_state.get("error")
-
-            if error_data:
-                log.error("AI graph returned error", error=error_data)
-
-            # 3. Сохранение в кэш
-            if result_data:
-                log.info("Saving results to cache")
-                json_data = {"items": [item.model_dump() for item in result_data]}
-                await self.dictionary_repo.upsert(word, json_data)
-
-            # 4. Логирование
-            await self.history_repo.create(
-                source=source,
-                original_text=word,
-            )
-
+            associations = self._cache.get(word)
+            if associations is None:
+                # shield: отмена этого запроса не должна отменять общий анализ,
+                # которого могут ждать другие запросы того же слова
+                result = await asyncio.shield(self._analyze_singleflight(word, log))
+                self.history.enqueue(source=source, original_text=word)
+                return result
+
+            log.info("Memory cache hit for word")
+            self.history.enqueue(source=source, original_text=word)
             return {
-                "result": result_data,
-                "error": error_data,
-                "status": ProcessingStatus.COMPLETED if not error_data else ProcessingStatus.FAILED
+                "result": associations,
+                "error": None,
+                "status": ProcessingStatus.COMPLETED
             }
-
         except ValueError as e:
             log.warning("Validation error or unknown word", error=str(e))
             return {
@@ -134,3 +114,100 @@ class LinguisticService:
                 "status": ProcessingStatus.FAILED
             }
 
+    def _analyze_singleflight(self, word: str, log: Any) -> asyncio.Task:
+        """Возвращает общую задачу анализа слова.
+
+        Пока анализ выполняется, его задача доступна в _inflight, и запросы
+        того же слова ожидают ее вместо повторного вызова LLM. Анализ идет
+        в отдельной задаче, поэтому отмена запроса, который его начал
+        (разрыв соединения, остановка бота), не затрагивает остальных.
+
+        Args:
+            word: Нормализованное слово.
+            log: Логгер с контекстом запроса.
+
+        Returns:
+            asyncio.Task: Задача, результат которой — словарь из analyze_word.
+        """
+        task = self._inflight.get(word)
+        if task is not None:
+            log.info("Joining in-flight analysis")
+            return task
+
+        task = asyncio.create_task(self._analyze_uncached(word, log))
+        self._inflight[word] = task
+        task.add_done_callback(partial(self._forget_inflight, word))
+        return task
+
+    def _forget_inflight(self, word: str, task: asyncio.Task) -> None:
+        """Убирает завершенную задачу анализа из _inflight.
+
+        Args:
+            word: Нормализованное слово.
+            task: Завершенная задача анализа.
+        """
+        if self._inflight.get(word) is task:
+            del self._inflight[word]
+        if not task.cancelled():
+            # Помечаем исключение полученным, даже если все ожидавшие отменены
+            task.exception()
+
+    async def _analyze_uncached(self, word: str, log: Any) -> Dict[str, Any]:
+        """Анализирует слово, отсутствующее в памяти процесса.
+
+        История запроса здесь не пишется: ее добавляет каждый ожидавший
+        результат запрос со своим источником.
+
+        Args:
+            word: Нормализованное слово.
+            log: Логгер с контекстом запроса.
+
+        Returns:
+            Dict[str, Any]: Словарь с результатами анализа (см. analyze_word).
+        """
+        # 1. Проверка кэша (короткая сессия только на чтение)
+        async with self.session_factory() as session:
+            cached_entry = await DictionaryRepository(session).get_by_word(word)
+        if cached_entry:
+            log.info("Cache hit for word")
+            associations_data = cached_entry.associations.get("items", [])
+            associations = [WordAssociation(**item) for item in associations_data]
+            self._cache[word] = associations
+            return {
+                "result": associations,
+                "error": None,
+                "status": ProcessingStatus.COMPLETED
+            }
+
+        # 2. Запрос к AI (соединение с БД на время вызова LLM возвращено в пул)
+        log.info("Cache miss, calling AI graph")
+        inputs = {"word": word, "result": None, "error": None}
+        result_state = await app_graph.ainvoke(inputs)
+
+        result_data = result_state.get("result")
+        error_data = result_state.get("error")
+
+        if error_data:
+            log.error("AI graph returned error", error=error_data)
+
+        # 3. Сохранение в кэш
+        if result_data:
+            log.info("Saving results to cache")
+            json_data = {"items": [item.model_dump() for item in result_data]}
+            async with self.session_factory() as session:
+                await DictionaryRepository(session).upsert(word, json_data)
+            self._cache[word] = result_data
+
+        return {
+            "result": result_data,
+            "error": error_data,
+            "status": ProcessingStatus.COMPLETED if not error_data else ProcessingStatus.FAILED
+        }
+
+    async def close(self) -> None:
+        """Освобождает ресурсы сервиса.
+
+        Дожидается сохранения накопленной истории запросов. Вызывается при
+        остановке приложения или бота.
+        """
+        await self.history.close()
@@ -54,5 +54,5 @@ if [ "$RUN_MODE" == "bot" ]; then
     exec python -m src.bot.main
 else
     echo -e "${GREEN}>>> Starting API Application...${NC}"
-    exec python -m uvicorn src.app.main:app --host 0.0.0.0 --port 8000 --proxy-headers --forwarded-allow-ips "*"
+    exec python -m uvicorn src.app.main:app --host 0.0.0.0 --port 8000 --loop uvloop --http httptools --proxy-headers --forwarded-allow-ips "*"
 fi
@@ -1,52 +1,159 @@
 import asyncio
+from contextlib import asynccontextmanager
+from functools import partial
 from typing import AsyncGenerator
 
 import pytest
-from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+import pytest_asyncio
+from asgi_lifespan import LifespanManager
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.pool import StaticPool
 
+try:
+    import uvloop
+except ImportError:  # uvloop is unavailable on Windows
+    uvloop = None
+
+from src.app.dependencies import get_linguistic_service
 from src.app.main import app
 from src.core.config import settings
 from src.infrastructure.db.base import Base, get_db
+from src.services.linguistic import LinguisticService
 
 # Use an in-memory SQLite database for testing
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
+# Durability is irrelevant for a throwaway in-memory database
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA locking_mode=EXCLUSIVE",
+)
 
-@pytest.fixture(scope="session")
-def event_loop():
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+
+def _serialized(factory):
+    # Concurrent requests share the single test connection, so their SAVEPOINTs
+    # must not interleave: only one session at a time may use it
+    lock = asyncio.Lock()
+
+    @asynccontextmanager
+    async def session():
+        async with lock, factory() as s:
+            yield s
+
+    return session
+
+
+# SQLite has no JSONB; store it as plain JSON in tests
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_sqlite(type_, compiler, **kw):
+    return "JSON"
 
 
 @pytest.fixture(scope="session")
+def event_loop_policy():
+    # The shared session loop runs on uvloop wherever it is installed, like the bot
+    return uvloop.EventLoopPolicy() if uvloop is not None else asyncio.DefaultEventLoopPolicy()
+
+
+def pytest_collection_modifyitems(items):
+    # Run every async test in the session loop shared with the fixtures
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest_asyncio.fixture(loop_scope="session", scope="session")
 async def test_engine():
-    engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+    # StaticPool keeps a single connection, so every test sees the same :memory: database
+    engine = create_async_engine(TEST_DATABASE_URL, echo=False, poolclass=StaticPool)
+
+    # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work with the sqlite3 driver.
+    # With StaticPool the PRAGMAs are applied once and hold for the whole session.
+    @event.listens_for(engine.sync_engine, "connect")
+    def _configure_connection(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    # _emit_begin opens a real transaction, so all DDL is committed in one go
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield engine
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
+    # Closing the only connection frees the :memory: database, no drop_all needed
     await engine.dispose()
 
 
-@pytest.fixture
-async def db_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
-    async_session = sessionmaker(
-        test_engine, class_=AsyncSession, expire_on_commit=False
+@pytest.fixture(scope="session")
+def session_factory() -> async_sessionmaker[AsyncSession]:
+    # Sessions join the per-test transaction: their commits only release a SAVEPOINT.
+    # autoflush is off, as in the application factory (see get_session_factory).
+    return async_sessionmaker(
+        expire_on_commit=False, autoflush=False, join_transaction_mode="create_savepoint"
     )
-    async with async_session() as session:
+
+
+@pytest_asyncio.fixture(loop_scope="session", scope="function")
+async def db_connection(test_engine) -> AsyncGenerator[AsyncConnection, None]:
+    async with test_engine.connect() as conn:
+        transaction = await conn.begin()
+        yield conn
+        await transaction.rollback()
+
+
+@pytest_asyncio.fixture(loop_scope="session", scope="function")
+async def db_session(db_connection) -> AsyncGenerator[AsyncSession, None]:
+    # Bound straight to the per-test connection, no factory call in between
+    async with AsyncSession(
+        bind=db_connection,
+        expire_on_commit=False,
+        autoflush=False,
+        join_transaction_mode="create_savepoint",
+    ) as session:
         yield session
 
 
-@pytest.fixture
-async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
+@pytest_asyncio.fixture(loop_scope="session", scope="session")
+async def started_app() -> AsyncGenerator[FastAPI, None]:
+    # The lifespan runs once per session; ASGITransport never sends lifespan events itself
+    async with LifespanManager(app):
+        yield app
+
+
+@pytest_asyncio.fixture(loop_scope="session", scope="session")
+async def http_client(started_app) -> AsyncGenerator[AsyncClient, None]:
+    # One client for the whole session: the ASGI transport and its pool are reused
+    # No timeouts: requests never leave the process, so httpx skips timer setup
+    transport = ASGITransport(app=started_app, raise_app_exceptions=True)
+    async with AsyncClient(transport=transport, base_url="http://test", timeout=None) as c:
+        yield c
+
+
+@pytest_asyncio.fixture(loop_scope="session", scope="function")
+async def client(
+    http_client, db_connection, db_session, session_factory
+) -> AsyncGenerator[AsyncClient, None]:
     async def override_get_db():
         yield db_session
 
+    service = LinguisticService(_serialized(partial(session_factory, bind=db_connection)))
+
     app.dependency_overrides[get_db] = override_get_db
-    async with AsyncClient(app=app, base_url="http://test") as c:
-        yield c
+    app.dependency_overrides[get_linguistic_service] = lambda: service
+    yield http_client
+    await service.close()
     app.dependency_overrides.clear()
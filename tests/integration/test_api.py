@@ -1,30 +1,81 @@
-from unittest.mock import AsyncMock, patch
+import asyncio
+from unittest.mock import patch
 
 import pytest
 from httpx import AsyncClient
 
+from src.core import WordAssociation
+from src.core.schemas import AssociationType
+
+# Built once per module. The result stays a list: the response model is assembled
+# with model_construct, so it must already have the type the graph returns.
+_GRAPH_OK = {
+    "result": [
+        WordAssociation(word="тест", type=AssociationType.SYNONYM),
+        WordAssociation(word="проверка", type=AssociationType.SYNONYM),
+    ],
+    "error": None,
+}
+
+
+async def _fake_ainvoke(state, *args, **kwargs):
+    return _GRAPH_OK
+
+
+@pytest.fixture(scope="module", autouse=True)
+def mock_graph():
+    # One patch for the whole module; a plain coroutine skips AsyncMock bookkeeping
+    with patch("src.services.linguistic.graph.app_graph.ainvoke", new=_fake_ainvoke):
+        yield
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("эксперимент", "эксперимент"),
+        ("  Счастье ", "счастье"),
+        ("северо-запад", "северо-запад"),
+    ],
+)
+async def test_process_text_endpoint(client: AsyncClient, text: str, expected: str):
+    response = await client.post(
+        "/api/analyze",
+        json={
+            "text": text,
+            "request_type": "synonym",
+            "language": "ru"
+        },
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["original_text"] == expected
+    assert data["request_type"] == "synonym"
+    assert data["status"] == "completed"
+    assert [item["word"] for item in data["result"]] == ["тест", "проверка"]
+
+
+@pytest.mark.asyncio
+async def test_process_text_endpoint_concurrent(client: AsyncClient):
+    words = ["дом", "лес", "река", "дом"]
+    payloads = [{"text": word, "request_type": "synonym", "language": "ru"} for word in words]
+
+    responses = await asyncio.gather(
+        *(client.post("/api/analyze", json=payload) for payload in payloads)
+    )
+
+    assert all(response.status_code == 200 for response in responses)
+    assert [response.json()["original_text"] for response in responses] == words
+    assert all(response.json()["status"] == "completed" for response in responses)
+
 
 @pytest.mark.asyncio
-async def test_process_text_endpoint(client: AsyncClient):
-    # Mocking the graph invocation
-    with patch("src.services.linguistic.graph.app_graph.ainvoke", new_callable=AsyncMock) as mock_graph_invoke:
-        mock_graph_invoke.return_value = {
-            "result": ["тест", "проверка"],
-            "error": None
-        }
-
-        response = await client.post(
-            "/linguistic/process",
-            json={
-                "text": "эксперимент",
-                "request_type": "synonym",
-                "language": "ru"
-            },
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["original_text"] == "эксперимент"
-        assert data["request_type"] == "synonym"
-        assert data["status"] == "completed"
-        assert data["result"] == ["тест", "проверка"]
+async def test_process_text_endpoint_rejects_long_word(client: AsyncClient):
+    response = await client.post(
+        "/api/analyze",
+        json={"text": "а" * 256, "request_type": "synonym", "language": "ru"},
+    )
+
+    assert response.status_code == 422
+    assert "не длиннее" in response.text
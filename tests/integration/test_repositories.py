@@ -0,0 +1,94 @@
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import select
+
+from src.infrastructure.db import RequestHistory
+from src.infrastructure.db.models import text_hash
+from src.infrastructure.repositories.history import HistoryRepository
+
+
+@pytest.mark.asyncio
+async def test_history_get_by_user_id_pages_through_all_rows(db_session):
+    repo = HistoryRepository(db_session)
+    user_id = uuid.uuid4()
+    earlier = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+    later = datetime(2024, 1, 2, 12, 0, tzinfo=timezone.utc)
+
+    # Explicit timestamps keep created_at identical to the re-bound cursor value on SQLite.
+    # One batch shares the later moment, the rest share the earlier one, so ties fall back to id.
+    await repo.create_many(
+        [
+            {"user_id": user_id, "source": "api", "original_text": f"слово{i}", "created_at": later}
+            for i in range(3)
+        ]
+    )
+    for i in range(3, 7):
+        await repo.create(user_id=user_id, source="web", original_text=f"слово{i}", created_at=earlier)
+    await repo.create(user_id=uuid.uuid4(), source="web", original_text="чужое", created_at=later)
+
+    pages = []
+    cursor = None
+    for _ in range(10):
+        rows, cursor = await repo.get_by_user_id(user_id, cursor=cursor, limit=3)
+        pages.append(rows)
+        if cursor is None:
+            break
+
+    rows = [row for page in pages for row in page]
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert len({row.id for row in rows}) == 7
+    # Newest first: the later batch leads, and rows with equal created_at are ordered by id
+    assert {row.original_text for row in rows[:3]} == {"слово0", "слово1", "слово2"}
+    keys = [(row.created_at, row.id) for row in rows]
+    assert keys == sorted(keys, reverse=True)
+    assert cursor is None
+
+
+@pytest.mark.asyncio
+async def test_history_text_hash_is_filled_on_insert(db_session):
+    repo = HistoryRepository(db_session)
+    user_id = uuid.uuid4()
+
+    await repo.create(user_id=user_id, source="web", original_text="дом")
+    await repo.create_many(
+        [
+            {"user_id": user_id, "source": "api", "original_text": "лес"},
+            {"user_id": user_id, "source": "api", "original_text": "река"},
+        ]
+    )
+
+    result = await db_session.execute(
+        select(RequestHistory.original_text, RequestHistory.text_hash).where(
+            RequestHistory.user_id == user_id
+        )
+    )
+    hashes = dict(result.all())
+    assert hashes == {word: text_hash(word) for word in ("дом", "лес", "река")}
+    assert [row.original_text for row in await repo.get_by_user_and_text(user_id, "лес")] == ["лес"]
+
+
+@pytest.mark.asyncio
+async def test_get_all_and_stream_all_return_models_or_projected_rows(db_session):
+    repo = HistoryRepository(db_session)
+    user_id = uuid.uuid4()
+    words = {f"поток{i}" for i in range(5)}
+    await repo.create_many([{"user_id": user_id, "source": "web", "original_text": word} for word in words])
+    columns = (RequestHistory.user_id, RequestHistory.original_text)
+
+    models = [row for row in await repo.get_all(limit=1000) if row.user_id == user_id]
+    assert all(isinstance(row, RequestHistory) for row in models)
+    assert {row.original_text for row in models} == words
+
+    projected = [row for row in await repo.get_all(limit=1000, columns=columns) if row.user_id == user_id]
+    assert not any(isinstance(row, RequestHistory) for row in projected)
+    assert {row.original_text for row in projected} == words
+
+    # batch_size smaller than the row count forces several yield_per fetches
+    streamed = [row async for row in repo.stream_all(batch_size=2) if row.user_id == user_id]
+    assert all(isinstance(row, RequestHistory) for row in streamed)
+    assert {row.original_text for row in streamed} == words
+
+    streamed_rows = [row async for row in repo.stream_all(columns=columns, batch_size=2) if row.user_id == user_id]
+    assert sorted(tuple(row) for row in streamed_rows) == sorted((user_id, word) for word in words)
@@ -0,0 +1,55 @@
+import uuid
+
+import pytest
+from sqlalchemy import BigInteger, Column, MetaData, String, Table, Uuid, create_engine, select
+
+from src.infrastructure.db.migrations.helpers import backfill_text_hash, batch_by_row_number
+from src.infrastructure.db.models import text_hash
+
+
+@pytest.fixture
+def connection():
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        yield conn
+    engine.dispose()
+
+
+def _legacy_history(connection):
+    # request_history as it looks right after add_column(text_hash, nullable=True)
+    history = Table(
+        "request_history",
+        MetaData(),
+        Column("id", Uuid, primary_key=True),
+        Column("original_text", String(255)),
+        Column("text_hash", BigInteger, nullable=True),
+    )
+    history.create(connection)
+    return history
+
+
+def test_batch_by_row_number_covers_table_in_ranges(connection):
+    history = _legacy_history(connection)
+    ids = sorted(uuid.uuid4() for _ in range(7))
+    connection.execute(history.insert(), [{"id": row_id, "original_text": "слово"} for row_id in ids])
+
+    ranges = list(batch_by_row_number(connection, history.c.id, chunk_size=3))
+
+    assert [lower for lower, _ in ranges] == [ids[0], ids[3], ids[6]]
+    assert [upper for _, upper in ranges[:-1]] == [lower for lower, _ in ranges[1:]]
+    assert ranges[-1][1] is None
+
+
+def test_backfill_text_hash_fills_missing_hashes(connection):
+    history = _legacy_history(connection)
+    words = [f"слово{i}" for i in range(7)]
+    connection.execute(
+        history.insert(),
+        [{"id": uuid.uuid4(), "original_text": word, "text_hash": None} for word in words],
+    )
+    connection.execute(history.insert(), {"id": uuid.uuid4(), "original_text": "готово", "text_hash": 42})
+
+    backfill_text_hash(connection, chunk_size=3)
+
+    hashes = dict(connection.execute(select(history.c.original_text, history.c.text_hash)).all())
+    assert hashes == {**{word: text_hash(word) for word in words}, "готово": 42}
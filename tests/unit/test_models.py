@@ -0,0 +1,26 @@
+import time
+import uuid
+
+from src.infrastructure.db.models import _uuid7
+
+
+def test_uuid7_sets_version_and_variant():
+    value = _uuid7()
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+
+
+def test_uuid7_embeds_current_millisecond_timestamp():
+    before = time.time_ns() // 1_000_000
+    value = _uuid7()
+    after = time.time_ns() // 1_000_000
+    assert before <= value.int >> 80 <= after
+
+
+def test_uuid7_sorts_by_creation_time():
+    values = []
+    for _ in range(5):
+        values.append(_uuid7())
+        time.sleep(0.002)
+    assert values == sorted(values)
+    assert [value.hex for value in values] == sorted(value.hex for value in values)
@@ -0,0 +1,185 @@
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.core import ProcessingStatus, WordAssociation
+from src.core.schemas import AssociationType
+from src.core.validators import WordValidator
+from src.services.linguistic import LinguisticService
+from src.services.linguistic.history import HistoryWriter
+
+_ASSOCIATIONS = (
+    WordAssociation(word="радость", type=AssociationType.SYNONYM),
+    WordAssociation(word="горе", type=AssociationType.ANTONYM),
+)
+_GRAPH_OK = {"result": _ASSOCIATIONS, "error": None}
+
+
+@asynccontextmanager
+async def _fake_session():
+    yield MagicMock()
+
+
+@pytest.fixture
+def dictionary_repo():
+    repo = MagicMock()
+    repo.get_by_word = AsyncMock(return_value=None)
+    repo.upsert = AsyncMock()
+    with patch("src.services.linguistic.service.DictionaryRepository", return_value=repo):
+        yield repo
+
+
+@pytest.fixture
+def history_repo():
+    repo = MagicMock()
+    repo.create_many = AsyncMock()
+    with patch("src.services.linguistic.history.HistoryRepository", return_value=repo):
+        yield repo
+
+
+@pytest.fixture
+def graph_invoke():
+    with patch("src.services.linguistic.service.app_graph.ainvoke", new_callable=AsyncMock) as mock:
+        mock.return_value = _GRAPH_OK
+        yield mock
+
+
+@pytest.mark.asyncio
+async def test_analyze_word_serves_repeated_word_from_memory(dictionary_repo, history_repo, graph_invoke):
+    service = LinguisticService(_fake_session)
+
+    first = await service.analyze_word(WordValidator.normalize("Счастье"), source="api")
+    second = await service.analyze_word("счастье", source="web")
+
+    await service.close()
+
+    assert first["status"] == second["status"] == ProcessingStatus.COMPLETED
+    assert second["result"] == _ASSOCIATIONS
+    assert graph_invoke.await_count == 1
+    assert dictionary_repo.get_by_word.await_count == 1
+    assert sum(len(call.args[0]) for call in history_repo.create_many.await_args_list) == 2
+
+
+@pytest.mark.asyncio
+async def test_analyze_word_releases_session_during_llm_call(dictionary_repo, history_repo):
+    open_sessions = 0
+
+    @asynccontextmanager
+    async def counting_session():
+        nonlocal open_sessions
+        open_sessions += 1
+        try:
+            yield MagicMock()
+        finally:
+            open_sessions -= 1
+
+    async def fake_ainvoke(state):
+        assert open_sessions == 0
+        return _GRAPH_OK
+
+    with patch("src.services.linguistic.service.app_graph.ainvoke", new=fake_ainvoke):
+        service = LinguisticService(counting_session)
+        result = await service.analyze_word("счастье")
+    await service.close()
+
+    assert result["status"] == ProcessingStatus.COMPLETED
+    dictionary_repo.upsert.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_analyze_word_coalesces_concurrent_misses(dictionary_repo, history_repo):
+    calls = 0
+
+    async def slow_ainvoke(state):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return _GRAPH_OK
+
+    service = LinguisticService(_fake_session)
+    with patch("src.services.linguistic.service.app_graph.ainvoke", new=slow_ainvoke):
+        results = await asyncio.gather(*(service.analyze_word("счастье") for _ in range(5)))
+    await service.close()
+
+    assert all(result["result"] == _ASSOCIATIONS for result in results)
+    assert calls == 1
+    assert service._inflight == {}
+    assert sum(len(call.args[0]) for call in history_repo.create_many.await_args_list) == 5
+
+
+@pytest.mark.asyncio
+async def test_analyze_word_shares_failure_with_concurrent_requests(dictionary_repo, history_repo):
+    calls = 0
+
+    async def failing_ainvoke(state):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise RuntimeError("LLM unavailable")
+
+    service = LinguisticService(_fake_session)
+    with patch("src.services.linguistic.service.app_graph.ainvoke", new=failing_ainvoke):
+        results = await asyncio.gather(*(service.analyze_word("счастье") for _ in range(3)))
+    await service.close()
+
+    assert all(result["status"] == ProcessingStatus.FAILED for result in results)
+    assert calls == 1
+    assert service._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_analyze_word_survives_cancelled_leader(dictionary_repo, history_repo):
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def blocking_ainvoke(state):
+        started.set()
+        await release.wait()
+        return _GRAPH_OK
+
+    service = LinguisticService(_fake_session)
+    with patch("src.services.linguistic.service.app_graph.ainvoke", new=blocking_ainvoke):
+        leader = asyncio.create_task(service.analyze_word("счастье"))
+        await started.wait()
+        joiner = asyncio.create_task(service.analyze_word("счастье"))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        release.set()
+        result = await joiner
+    await service.close()
+
+    assert result["status"] == ProcessingStatus.COMPLETED
+    assert result["result"] == _ASSOCIATIONS
+    assert service._inflight == {}
+    assert sum(len(call.args[0]) for call in history_repo.create_many.await_args_list) == 1
+
+
+@pytest.mark.asyncio
+async def test_history_writer_flushes_rows_in_one_batch(history_repo):
+    writer = HistoryWriter(_fake_session, batch_size=10, flush_interval=0.01)
+
+    for word in ("один", "два", "три"):
+        writer.enqueue(source="api", original_text=word)
+    await writer.close()
+
+    history_repo.create_many.assert_awaited_once()
+    rows = history_repo.create_many.await_args.args[0]
+    assert [row["original_text"] for row in rows] == ["один", "два", "три"]
+
+
+@pytest.mark.asyncio
+async def test_history_writer_drops_rows_when_queue_is_full(history_repo):
+    writer = HistoryWriter(_fake_session, batch_size=2, flush_interval=0.01, max_pending=3)
+
+    # The background task does not run until the first await, so the queue only fills up
+    for i in range(5):
+        writer.enqueue(source="api", original_text=f"слово{i}")
+    await writer.close()
+
+    rows = [row for call in history_repo.create_many.await_args_list for row in call.args[0]]
+    assert [row["original_text"] for row in rows] == ["слово0", "слово1", "слово2"]
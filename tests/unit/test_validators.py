@@ -0,0 +1,68 @@
+import pytest
+
+from src.core.validators import MAX_WORD_LENGTH, WordValidator, _is_cyrillic
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("счастье", True),
+        ("Счастье", True),
+        ("  ёлка  ", True),
+        ("северо-запад", True),
+        ("hello", False),
+        ("слово1", False),
+        ("", False),
+        ("   ", False),
+        ("-", True),
+        ("а" * MAX_WORD_LENGTH, True),
+        ("а" * (MAX_WORD_LENGTH + 1), True),
+    ],
+)
+def test_is_cyrillic(text: str, expected: bool):
+    assert WordValidator.is_cyrillic(text) is expected
+
+
+def test_is_cyrillic_shares_cache_between_cases():
+    _is_cyrillic.cache_clear()
+    WordValidator.is_cyrillic("Счастье")
+    WordValidator.is_cyrillic(" счастье ")
+    info = _is_cyrillic.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+
+def test_is_cyrillic_skips_cache_for_ascii():
+    _is_cyrillic.cache_clear()
+    WordValidator.is_cyrillic("hello")
+    assert _is_cyrillic.cache_info().currsize == 0
+
+
+def test_is_cyrillic_skips_cache_for_long_text():
+    _is_cyrillic.cache_clear()
+    assert WordValidator.is_cyrillic("а" * (MAX_WORD_LENGTH * 10)) is True
+    assert _is_cyrillic.cache_info().currsize == 0
+
+
+def test_is_too_long():
+    assert WordValidator.is_too_long("а" * MAX_WORD_LENGTH) is False
+    assert WordValidator.is_too_long("а" * (MAX_WORD_LENGTH + 1)) is True
+
+
+def test_validate_word_checks_length_after_strip():
+    WordValidator.validate_word(f"  {'а' * MAX_WORD_LENGTH}  ")
+    with pytest.raises(ValueError, match="не длиннее"):
+        WordValidator.validate_word("а" * (MAX_WORD_LENGTH + 1))
+
+
+def test_validate_word_returns_normalized_word():
+    assert WordValidator.validate_word("  Счастье ") == "счастье"
+
+
+def test_validate_word_raises_on_latin():
+    with pytest.raises(ValueError):
+        WordValidator.validate_word("word")
+
+
+def test_normalize_strips_and_lowercases():
+    assert WordValidator.normalize("  Счастье ") == "счастье"